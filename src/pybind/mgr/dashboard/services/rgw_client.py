@@ -6,6 +6,7 @@ import logging
 import re
 import xml.etree.ElementTree as ET  # noqa: N814
 from distutils.util import strtobool
+from functools import lru_cache
 
 from .. import mgr
 from ..awsauth import S3Auth
@@ -15,7 +16,7 @@ from ..settings import Settings
 from ..tools import build_url, dict_contains_path, dict_get, json_str_to_object
 
 try:
-    from typing import Any, Dict, List, Optional, Tuple
+    from typing import Any, Callable, Dict, List, Optional, Tuple
 except ImportError:
     pass  # For typing only
 
@@ -166,6 +167,61 @@ def _parse_addr(value) -> str:
     raise LookupError('Failed to determine RGW address')
 
 
+_BEAST_ENDPOINT_RE = re.compile(r'([\d.]+|\[.+\])(:(\d+))?')
+
+
+def _parse_beast_config(options: str) -> Optional[Tuple[int, bool]]:
+    """
+    Get the port and SSL usage from the options of a Beast frontend
+    configuration, or None if they can not be determined.
+    """
+    for option in options.split():
+        option_name, _, value = option.partition('=')
+        if option_name in ['port', 'ssl_port']:
+            if value.isdecimal():
+                return int(value), option_name == 'ssl_port'
+            break
+        if option_name in ['endpoint', 'ssl_endpoint']:
+            match = _BEAST_ENDPOINT_RE.match(value)
+            if match:
+                port = int(match.group(3)) if \
+                    match.group(2) is not None else 443 if \
+                    option_name == 'ssl_endpoint' else \
+                    80
+                return port, option_name == 'ssl_endpoint'
+            break
+    return None
+
+
+def _parse_civetweb_config(options: str) -> Optional[Tuple[int, bool]]:
+    """
+    Get the port and SSL usage from the options of a civetweb frontend
+    configuration, or None if they can not be determined.
+    """
+    for option in options.split():
+        option_name, _, value = option.partition('=')
+        if option_name == 'port':
+            # Only the first of the listening ports is of interest, e.g.
+            # '127.0.0.1:8443s+8000' or '80r,443s'. It may be suffixed
+            # with 's' (SSL) or 'r' (redirect to an SSL port).
+            value = value.split(',', 1)[0].split('+', 1)[0]
+            ssl = value.endswith('s')
+            if value[-1:] in ['s', 'r']:
+                value = value[:-1]
+            port = value.rpartition(':')[2]
+            if port.isdecimal():
+                return int(port), ssl
+            break
+    return None
+
+
+_FRONTEND_PARSERS: Dict[str, Callable[[str], Optional[Tuple[int, bool]]]] = {
+    'beast': _parse_beast_config,
+    'civetweb': _parse_civetweb_config,
+}
+
+
+@lru_cache(maxsize=64)
 def _parse_frontend_config(config) -> Tuple[int, bool]:
     """
     Get the port the RGW is running on. Due the complexity of the
@@ -185,36 +241,12 @@ def _parse_frontend_config(config) -> Tuple[int, bool]:
              whether SSL is used.
     :rtype: (int, boolean)
     """
-    match = re.search(r'^(beast|civetweb)\s+.+$', config)
-    if match:
-        if match.group(1) == 'beast':
-            match = re.search(r'(port|ssl_port|endpoint|ssl_endpoint)=(.+)',
-                              config)
-            if match:
-                option_name = match.group(1)
-                if option_name in ['port', 'ssl_port']:
-                    match = re.search(r'(\d+)', match.group(2))
-                    if match:
-                        port = int(match.group(1))
-                        ssl = option_name == 'ssl_port'
-                        return port, ssl
-                if option_name in ['endpoint', 'ssl_endpoint']:
-                    match = re.search(r'([\d.]+|\[.+\])(:(\d+))?',
-                                      match.group(2))  # type: ignore
-                    if match:
-                        port = int(match.group(3)) if \
-                            match.group(2) is not None else 443 if \
-                            option_name == 'ssl_endpoint' else \
-                            80
-                        ssl = option_name == 'ssl_endpoint'
-                        return port, ssl
-        if match.group(1) == 'civetweb':  # type: ignore
-            match = re.search(r'port=(.*:)?(\d+)(s)?', config)
-            if match:
-                port = int(match.group(2))
-                ssl = match.group(3) == 's'
-                return port, ssl
-    raise LookupError('Failed to determine RGW port from "{}"'.format(config))
+    frontend, _, options = ' '.join(config.split()).partition(' ')
+    parser = _FRONTEND_PARSERS.get(frontend)
+    result = parser(options) if parser else None
+    if result is None:
+        raise LookupError('Failed to determine RGW port from "{}"'.format(config))
+    return result
 
 
 class RgwClient(RestClient):
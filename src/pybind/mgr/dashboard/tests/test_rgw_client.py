@@ -1,17 +1,32 @@
 # -*- coding: utf-8 -*-
-# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-public-methods,protected-access
 import unittest
 
+import pytest
+
 try:
-    from unittest.mock import MagicMock, patch
+    from unittest.mock import MagicMock
 except ImportError:
-    from mock import MagicMock, patch  # type: ignore
+    from mock import MagicMock  # type: ignore
 
 from ..services.rgw_client import NoCredentialsException, RgwClient, \
     RgwDaemon, _parse_frontend_config
 from ..settings import Settings
 from . import KVStoreMockMixin  # pylint: disable=no-name-in-module
 
+_CREDS = {
+    'RGW_API_ACCESS_KEY': 'klausmustermann',
+    'RGW_API_SECRET_KEY': 'supergeheim',
+}
+_NO_CREDS = {
+    'RGW_API_ACCESS_KEY': '',
+    'RGW_API_SECRET_KEY': '',
+}
+_WRONG_HOST = {
+    'RGW_API_HOST': 'localhost',
+    'RGW_API_PORT': '7990',
+}
+
 
 def _get_daemons_stub():
     daemon = RgwDaemon()
@@ -23,16 +38,35 @@ def _get_daemons_stub():
     return {daemon.name: daemon}
 
 
-@patch('dashboard.services.rgw_client._get_daemons', _get_daemons_stub)
-@patch('dashboard.services.rgw_client.RgwClient._get_user_id', MagicMock(
-    return_value='dummy_admin'))
 class RgwClientTest(unittest.TestCase, KVStoreMockMixin):
+    _shared_instance: RgwClient
+
+    @classmethod
+    def setUpClass(cls):
+        # The daemon list and the KV store mocks are the same for all
+        # tests, so they are only set up once. Tests that neither change
+        # the settings nor expect a failure share a single admin instance.
+        RgwClient._daemons = _get_daemons_stub()
+        cls.mock_kv_store()
+        cls.CONFIG_KEY_DICT.update(_CREDS)
+        cls._orig_get_user_id = RgwClient._get_user_id
+        RgwClient._get_user_id = MagicMock(return_value='dummy_admin')  # type: ignore
+        try:
+            cls._shared_instance = RgwClient.admin_instance()
+        except Exception:
+            # tearDownClass() is not run if setUpClass() fails.
+            cls.tearDownClass()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        RgwClient._get_user_id = cls._orig_get_user_id  # type: ignore
+        RgwClient.drop_instance()
+        RgwClient._daemons = {}
+
     def setUp(self):
-        self.mock_kv_store()
-        self.CONFIG_KEY_DICT.update({
-            'RGW_API_ACCESS_KEY': 'klausmustermann',
-            'RGW_API_SECRET_KEY': 'supergeheim',
-        })
+        self.CONFIG_KEY_DICT.clear()
+        self.CONFIG_KEY_DICT.update(_CREDS)
 
     def test_ssl_verify(self):
         Settings.RGW_API_SSL_VERIFY = True
@@ -45,26 +79,19 @@ class RgwClientTest(unittest.TestCase, KVStoreMockMixin):
         self.assertFalse(instance.session.verify)
 
     def test_no_credentials(self):
-        self.CONFIG_KEY_DICT.update({
-            'RGW_API_ACCESS_KEY': '',
-            'RGW_API_SECRET_KEY': '',
-        })
+        self.CONFIG_KEY_DICT.update(_NO_CREDS)
         with self.assertRaises(NoCredentialsException) as cm:
             RgwClient.admin_instance()
         self.assertIn('No RGW credentials found', str(cm.exception))
 
     def test_default_daemon_wrong_settings(self):
-        self.CONFIG_KEY_DICT.update({
-            'RGW_API_HOST': 'localhost',
-            'RGW_API_PORT': '7990',
-        })
+        self.CONFIG_KEY_DICT.update(_WRONG_HOST)
         with self.assertRaises(LookupError) as cm:
             RgwClient.admin_instance()
         self.assertIn('No RGW daemon found with host:', str(cm.exception))
 
-    @patch.object(RgwClient, '_get_daemon_zone_info')
-    def test_get_placement_targets_from_zone(self, zone_info):
-        zone_info.return_value = {
+    def test_get_placement_targets_from_zone(self):
+        zone_info = MagicMock(return_value={
             'id': 'a0df30ea-4b5b-4830-b143-2bedf684663d',
             'placement_pools': [
                 {
@@ -79,9 +106,9 @@ class RgwClientTest(unittest.TestCase, KVStoreMockMixin):
                     }
                 }
             ]
-        }
+        })
 
-        instance = RgwClient.admin_instance()
+        instance = self._shared_instance
         expected_result = {
             'zonegroup': 'zonegroup2-realm1',
             'placement_targets': [
@@ -91,11 +118,15 @@ class RgwClientTest(unittest.TestCase, KVStoreMockMixin):
                 }
             ]
         }
-        self.assertEqual(expected_result, instance.get_placement_targets())
-
-    @patch.object(RgwClient, '_get_realms_info')
-    def test_get_realms(self, realms_info):
-        realms_info.side_effect = [
+        orig_zone_info = RgwClient._get_daemon_zone_info
+        RgwClient._get_daemon_zone_info = zone_info  # type: ignore
+        try:
+            self.assertEqual(expected_result, instance.get_placement_targets())
+        finally:
+            RgwClient._get_daemon_zone_info = orig_zone_info  # type: ignore
+
+    def test_get_realms(self):
+        realms_info = MagicMock(side_effect=[
             {
                 'default_info': '51de8373-bc24-4f74-a9b7-8e9ef4cb71f7',
                 'realms': [
@@ -104,91 +135,61 @@ class RgwClientTest(unittest.TestCase, KVStoreMockMixin):
                 ]
             },
             {}
-        ]
-        instance = RgwClient.admin_instance()
-
-        self.assertEqual(['realm1', 'realm2'], instance.get_realms())
-        self.assertEqual([], instance.get_realms())
-
-
-class RgwClientHelperTest(unittest.TestCase):
-    def test_parse_frontend_config_1(self):
-        self.assertEqual(_parse_frontend_config('beast port=8000'), (8000, False))
-
-    def test_parse_frontend_config_2(self):
-        self.assertEqual(_parse_frontend_config('beast port=80 port=8000'), (80, False))
-
-    def test_parse_frontend_config_3(self):
-        self.assertEqual(_parse_frontend_config('beast ssl_port=443 port=8000'), (443, True))
-
-    def test_parse_frontend_config_4(self):
-        self.assertEqual(_parse_frontend_config('beast endpoint=192.168.0.100:8000'), (8000, False))
-
-    def test_parse_frontend_config_5(self):
-        self.assertEqual(_parse_frontend_config('beast endpoint=[::1]'), (80, False))
-
-    def test_parse_frontend_config_6(self):
-        self.assertEqual(_parse_frontend_config(
-            'beast ssl_endpoint=192.168.0.100:8443'), (8443, True))
-
-    def test_parse_frontend_config_7(self):
-        self.assertEqual(_parse_frontend_config('beast ssl_endpoint=192.168.0.100'), (443, True))
-
-    def test_parse_frontend_config_8(self):
-        self.assertEqual(_parse_frontend_config(
-            'beast ssl_endpoint=[::1]:8443 endpoint=192.0.2.3:80'), (8443, True))
-
-    def test_parse_frontend_config_9(self):
-        self.assertEqual(_parse_frontend_config(
-            'beast port=8080 endpoint=192.0.2.3:80'), (8080, False))
-
-    def test_parse_frontend_config_10(self):
-        self.assertEqual(_parse_frontend_config(
-            'beast ssl_endpoint=192.0.2.3:8443 port=8080'), (8443, True))
-
-    def test_parse_frontend_config_11(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=8000s'), (8000, True))
-
-    def test_parse_frontend_config_12(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=443s port=8000'), (443, True))
-
-    def test_parse_frontend_config_13(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=192.0.2.3:80'), (80, False))
-
-    def test_parse_frontend_config_14(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=172.5.2.51:8080s'), (8080, True))
-
-    def test_parse_frontend_config_15(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=[::]:8080'), (8080, False))
-
-    def test_parse_frontend_config_16(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=ip6-localhost:80s'), (80, True))
-
-    def test_parse_frontend_config_17(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=[2001:0db8::1234]:80'), (80, False))
-
-    def test_parse_frontend_config_18(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=[::1]:8443s'), (8443, True))
-
-    def test_parse_frontend_config_19(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=127.0.0.1:8443s+8000'), (8443, True))
-
-    def test_parse_frontend_config_20(self):
-        self.assertEqual(_parse_frontend_config('civetweb port=127.0.0.1:8080+443s'), (8080, False))
-
-    def test_parse_frontend_config_21(self):
-        with self.assertRaises(LookupError) as ctx:
-            _parse_frontend_config('civetweb port=xyz')
-        self.assertEqual(str(ctx.exception),
-                         'Failed to determine RGW port from "civetweb port=xyz"')
-
-    def test_parse_frontend_config_22(self):
-        with self.assertRaises(LookupError) as ctx:
-            _parse_frontend_config('civetweb')
-        self.assertEqual(str(ctx.exception), 'Failed to determine RGW port from "civetweb"')
-
-    def test_parse_frontend_config_23(self):
-        with self.assertRaises(LookupError) as ctx:
-            _parse_frontend_config('mongoose port=8080')
-        self.assertEqual(str(ctx.exception),
-                         'Failed to determine RGW port from "mongoose port=8080"')
+        ])
+        instance = self._shared_instance
+
+        orig_realms_info = RgwClient._get_realms_info
+        RgwClient._get_realms_info = realms_info  # type: ignore
+        try:
+            self.assertEqual(['realm1', 'realm2'], instance.get_realms())
+            self.assertEqual([], instance.get_realms())
+        finally:
+            RgwClient._get_realms_info = orig_realms_info  # type: ignore
+
+
+@pytest.mark.parametrize(
+    'config,expected',
+    [
+        ('beast port=8000', (8000, False)),
+        ('beast port=80 port=8000', (80, False)),
+        ('beast\tport=8000', (8000, False)),
+        ('beast ssl_port=443 port=8000', (443, True)),
+        ('beast endpoint=192.168.0.100:8000', (8000, False)),
+        ('beast endpoint=[::1]', (80, False)),
+        ('beast ssl_endpoint=192.168.0.100:8443', (8443, True)),
+        ('beast ssl_endpoint=192.168.0.100', (443, True)),
+        ('beast ssl_endpoint=[::1]:8443 endpoint=192.0.2.3:80', (8443, True)),
+        ('beast port=8080 endpoint=192.0.2.3:80', (8080, False)),
+        ('beast ssl_endpoint=192.0.2.3:8443 port=8080', (8443, True)),
+        ('civetweb port=8000s', (8000, True)),
+        ('civetweb port=443s port=8000', (443, True)),
+        ('civetweb port=192.0.2.3:80', (80, False)),
+        ('civetweb port=172.5.2.51:8080s', (8080, True)),
+        ('civetweb port=[::]:8080', (8080, False)),
+        ('civetweb port=ip6-localhost:80s', (80, True)),
+        ('civetweb port=[2001:0db8::1234]:80', (80, False)),
+        ('civetweb port=[::1]:8443s', (8443, True)),
+        ('civetweb port=127.0.0.1:8443s+8000', (8443, True)),
+        ('civetweb port=127.0.0.1:8080+443s', (8080, False)),
+        ('civetweb port=80r+443s', (80, False)),
+        ('civetweb port=80r,443s', (80, False)),
+    ]
+)
+def test_parse_frontend_config(config, expected):
+    assert _parse_frontend_config(config) == expected
+
+
+@pytest.mark.parametrize(
+    'config',
+    [
+        'civetweb port=xyz',
+        'civetweb port=²',
+        'beast port=²',
+        'civetweb',
+        'mongoose port=8080',
+    ]
+)
+def test_parse_frontend_config_error(config):
+    with pytest.raises(LookupError) as ctx:
+        _parse_frontend_config(config)
+    assert str(ctx.value) == 'Failed to determine RGW port from "{}"'.format(config)